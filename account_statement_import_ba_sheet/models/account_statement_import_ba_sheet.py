@@ -1,9 +1,15 @@
 
 import base64
+import hashlib
 import io
 import logging
 import re
+import sys
+import time
+from collections import namedtuple
 from datetime import datetime, date
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, Optional, List, Tuple, Set
 
 from odoo import _, models, fields
@@ -35,22 +41,87 @@ OPTIONAL_HEADERS = [
 ]
 
 ALL_HEADERS = REQUIRED_HEADERS + OPTIONAL_HEADERS
+_ALL_HEADERS_SET = frozenset(ALL_HEADERS)
+
+# One data row: a field per ALL_HEADERS entry, in that order ("payer name" →
+# .payer_name); columns absent from the sheet are None.
+_Row = namedtuple("_Row", [h.replace(" ", "_") for h in ALL_HEADERS])
+# Column index used for absent optional columns: never < len(row) → None.
+_NO_COL = sys.maxsize
+
+# Accepted values of the "currency" column (compared upper-cased).
+_EUR_CURRENCIES = frozenset(("EUR", "€"))
+
+# ---- Precompiled patterns (hot per-row helpers) ----
+_RE_WS = re.compile(r"\s+")
+_RE_NONNUM = re.compile(r"[^0-9.\-]")
+# _parse_number: drop (thousands) spaces; "1.234,56" → "1234.56" in one pass.
+_NUM_DROP_SPACES = str.maketrans("", "", " \xa0")
+_NUM_DECIMAL_COMMA = str.maketrans({".": None, ",": "."})
+# Anything _sanitize_val would change: '|', non-space whitespace, double/edge spaces.
+_RE_NEEDS_SANITIZE = re.compile(r"[|]|[^\S ]|  |^ | $")
+# Single-char rewrites for _sanitize_val, applied in one pass.
+_SANITIZE_TRANS = str.maketrans({"\r": " ", "\n": " ", "|": "/"})
 
 def _norm(s: str) -> str:
     s = (s or "").strip()
     s = " ".join(s.split()).lower()
     return s
 
+def _map_headers(header_row) -> Dict[str, int]:
+    """Map the strict header labels to column indices; raise on missing required ones."""
+    norm = [_norm(str(h or "").strip()) for h in header_row]
+    idx = {}
+    for i, h in enumerate(norm):
+        if h in _ALL_HEADERS_SET:
+            idx[h] = i
+    missing = [h for h in REQUIRED_HEADERS if h not in idx]
+    if missing:
+        raise UserError(_("Missing required columns: %s") % ", ".join(missing))
+    return idx
+
+def _row_positions(idx: Dict[str, int]) -> Tuple[int, ...]:
+    """Sheet column per _Row field (see _map_headers); _NO_COL for absent ones."""
+    return tuple(idx.get(h, _NO_COL) for h in ALL_HEADERS)
+
+def _calamine_workbook_cls():
+    """``CalamineWorkbook`` if a usable python-calamine is installed, else None."""
+    try:
+        from python_calamine import CalamineSheet, CalamineWorkbook
+    except ImportError:
+        return None
+    # Older releases have no streaming CalamineSheet.iter_rows → use the fallbacks.
+    return CalamineWorkbook if hasattr(CalamineSheet, "iter_rows") else None
+
+# calamine types XLSX cells differently from openpyxl. unique_import_id and
+# payment_ref embed cell text, so calamine values are normalized to openpyxl's.
+def _calamine_cell_xlsx(v):
+    """calamine XLSX cell → openpyxl value (int for integral numbers, datetime for dates)."""
+    cls = v.__class__
+    if cls is float:
+        # openpyxl yields int unless the stored text is "4711.5"/"1E+16"-like.
+        return int(v) if v.is_integer() and -1e16 < v < 1e16 else v
+    if cls is str:
+        return v or None
+    if cls is date:
+        return datetime(v.year, v.month, v.day)
+    return v
+
+_SIG_XLSX = b"PK\x03\x04"  # ZIP 'PK..'
+_SIG_XLS = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"  # OLE CFBF
+
 def _excel_kind(content: bytes) -> Optional[str]:
-    sig_xlsx = bytes([0x50, 0x4B, 0x03, 0x04])  # ZIP 'PK..'
-    sig_xls  = bytes([0xD0, 0xCF, 0x11, 0xE0, 0xA1, 0xB1, 0x1A, 0xE1])  # OLE CFBF
-    if content[:4] == sig_xlsx:
+    # startswith() compares in place; no prefix slice is copied.
+    if content.startswith(_SIG_XLSX):
         return "xlsx"
-    if content[:8] == sig_xls:
+    if content.startswith(_SIG_XLS):
         return "xls"
     return None
 
-_DATE_PATTERNS = ["%Y-%m-%d","%d.%m.%Y","%d.%m.%y","%Y/%m/%d","%d/%m/%Y","%m/%d/%Y"]
+# Bank Austria exports use "%d.%m.%Y" → try it first.
+_DATE_PATTERNS = ["%d.%m.%Y","%Y-%m-%d","%d.%m.%y","%Y/%m/%d","%d/%m/%Y","%m/%d/%Y"]
+# (separator, format): a format can only match if its separator occurs in the string.
+_DATE_PATTERNS_SEP = tuple((fmt[2], fmt) for fmt in _DATE_PATTERNS)
 
 def _to_iso_date(val) -> str:
     """Best-effort to get YYYY-MM-DD string (for logs and payload)."""
@@ -58,8 +129,26 @@ def _to_iso_date(val) -> str:
         return val.date().isoformat()
     if isinstance(val, date):
         return val.isoformat()
-    s = (str(val or "").strip())
-    for fmt in _DATE_PATTERNS:
+    # Text cells are already str; only other odd types need str().
+    s = val.strip() if isinstance(val, str) else str(val or "").strip()
+    return _to_iso_date_str(s) if s else ""
+
+@lru_cache(maxsize=4096)
+def _to_iso_date_str(s: str) -> str:
+    """String branch of _to_iso_date; cached since dates repeat across rows."""
+    # Fixed-width shapes of the two common formats, without strptime.
+    # A shape match that is no valid date falls through to the generic path.
+    if len(s) == 10 and s.isascii():
+        try:
+            if s[2] == "." and s[5] == "." and s.replace(".", "").isdigit():  # %d.%m.%Y
+                return date(int(s[6:]), int(s[3:5]), int(s[:2])).isoformat()
+            if s[4] == "-" and s[7] == "-" and s.replace("-", "").isdigit():  # %Y-%m-%d
+                return date(int(s[:4]), int(s[5:7]), int(s[8:])).isoformat()
+        except ValueError:
+            pass
+    for sep, fmt in _DATE_PATTERNS_SEP:
+        if sep not in s:
+            continue
         try:
             return datetime.strptime(s, fmt).date().isoformat()
         except Exception:
@@ -70,23 +159,25 @@ def _to_iso_date(val) -> str:
         return s
 
 def _parse_number(val) -> float:
-    if val in (None, ""):
-        return 0.0
+    # Native numeric cells are the common case (data_only XLSX) → return first.
+    if type(val) is float:
+        return val
     if isinstance(val, (int, float)):
         return float(val)
-    s = str(val).strip().replace("\xa0"," ")
-    s = s.replace(" ", "")
-    if "," in s and "." in s:
-        if s.rfind(",") > s.rfind("."):
-            s = s.replace(".","").replace(",",".")
+    if val is None or val == "":
+        return 0.0
+    s = str(val).strip().translate(_NUM_DROP_SPACES)
+    last_comma = s.rfind(",")
+    if last_comma >= 0:
+        # The later separator is the decimal one.
+        if last_comma > s.rfind("."):
+            s = s.translate(_NUM_DECIMAL_COMMA)
         else:
-            s = s.replace(",","")
-    elif "," in s:
-        s = s.replace(".","").replace(",",".")
+            s = s.replace(",", "")
     try:
         return float(s)
     except Exception:
-        s2 = re.sub(r"[^0-9\.-]","", s)
+        s2 = _RE_NONNUM.sub("", s)
         return float(s2) if s2 else 0.0
 
 def _format_amount(val: float) -> str:
@@ -98,15 +189,51 @@ def _sanitize_val(v: Optional[str]) -> Optional[str]:
     """
     if v is None:
         return None
-    s = str(v).replace("\r", " ").replace("\n", " ")
+    s = v if isinstance(v, str) else str(v)
+    # Fast path: already clean (typical IBANs, codes, names) → no rewrite.
+    if not _RE_NEEDS_SANITIZE.search(s):
+        return s or None
+    return _sanitize_dirty(s)
+
+@lru_cache(maxsize=8192)
+def _sanitize_dirty(s: str) -> Optional[str]:
+    """Rewrite branch of _sanitize_val; cached since multi-line purpose/booking
+    texts repeat for recurring counterparties. Clean values never get here.
+    """
+    s = s.translate(_SANITIZE_TRANS)
+    # Only single spaces left as whitespace (isprintable() is False for all other
+    # whitespace) → trimming the edges is all that remains; skip the list build.
+    if "  " not in s and s.isprintable():
+        return s.strip() or None
+    # split()/join also collapses the spaces and trims the edges.
     s = " ".join(s.split())
-    s = s.replace("|", "/")
-    s = s.strip()
     return s if s else None
 
 def _norm_acc(v: Optional[str]) -> str:
     """Normalize account numbers/IBANs for comparison (remove spaces, upper-case)."""
-    return re.sub(r"\s+", "", (v or "")).upper()
+    return _RE_WS.sub("", (v or "")).upper()
+
+# Row fields used for display/matching; sanitized once per row (see _sanitize_row).
+_SANITIZE_KEYS = (
+    "booking text",
+    "currency",
+    "payer name",
+    "payer account",
+    "payer bank code",
+    "payee name",
+    "payee account",
+    "payee bank code",
+    "purpose text",
+    "reference",
+    "record number",
+    "record data",
+)
+
+_SANITIZE_POS = tuple(ALL_HEADERS.index(k) for k in _SANITIZE_KEYS)
+
+def _sanitize_row(row: _Row) -> Dict[str, Optional[str]]:
+    """Sanitize all text fields of a row record once (missing columns → None)."""
+    return {k: _sanitize_val(row[i]) for k, i in zip(_SANITIZE_KEYS, _SANITIZE_POS)}
 
 def _get_owner_accounts(self) -> Set[str]:
     """Owner account sourced **only from context**:
@@ -130,20 +257,18 @@ def _get_owner_accounts(self) -> Set[str]:
     _logger.debug("BA sheet: owner accounts from context → %s", sorted(list(owners)) or ["<none>"])
     return owners
 
-def _choose_partner_name(self, row: Dict[str, object]) -> Optional[str]:
-    """Strict rule with context-only owner account(s):
+def _choose_partner_name(owner_accounts: Set[str], srow: Dict[str, Optional[str]]) -> Optional[str]:
+    """Strict rule with context-only owner account(s) (see _get_owner_accounts),
+    applied to a sanitized row (see _sanitize_row):
     - Require BOTH payer/payee account numbers present.
     - If exactly one of them belongs to owner_accounts, return the OTHER side's name.
     - Else: return None.
     """
-    owner_accounts = _get_owner_accounts(self)
     if not owner_accounts:
         return None
 
-    payer_name = _sanitize_val(row.get("payer name"))
-    payee_name = _sanitize_val(row.get("payee name"))
-    payer_acc = _norm_acc(row.get("payer account"))
-    payee_acc = _norm_acc(row.get("payee account"))
+    payer_acc = _norm_acc(srow["payer account"])
+    payee_acc = _norm_acc(srow["payee account"])
     if not payer_acc or not payee_acc:
         return None
 
@@ -151,122 +276,180 @@ def _choose_partner_name(self, row: Dict[str, object]) -> Optional[str]:
     payee_is_owner = payee_acc in owner_accounts
 
     if payer_is_owner ^ payee_is_owner:  # exactly one matches
-        return (payee_name if payer_is_owner else payer_name) or None
+        return srow["payee name"] if payer_is_owner else srow["payer name"]
 
     return None
 
-def _build_payment_ref(row: Dict[str, object], amount: float, op_date_iso: str, val_date_iso: str) -> str:
-    """Build the fixed, parseable payment_ref including BOTH payer and payee as provided."""
-    pieces = []
-    direction = "IN" if amount >= 0 else "OUT"
-    pieces.append(f"DIR={direction}")
-
-    bt = _sanitize_val(row.get("booking text"))
+def _build_payment_ref(srow: Dict[str, Optional[str]], amount: float, op_date_iso: str, val_date_iso: str) -> str:
+    """Build the fixed, parseable payment_ref including BOTH payer and payee as provided.
+    Expects a sanitized row (see _sanitize_row).
+    """
+    bt = srow["booking text"]
+    payer_name = srow["payer name"]
+    payer_acc_raw = srow["payer account"]
+    payer_bc = srow["payer bank code"]
+    payee_name = srow["payee name"]
+    payee_acc_raw = srow["payee account"]
+    payee_bc = srow["payee bank code"]
+    pt = srow["purpose text"]
+    ref = srow["reference"] or srow["record number"]
+    rd = srow["record data"]
+
+    # Fixed order; optional pieces are only appended when present, so the
+    # join needs no filter. Values are str already → plain "+" concatenation.
+    pieces = ["DIR=IN" if amount >= 0 else "DIR=OUT"]
     if bt:
-        pieces.append(f"BT={bt}")
-
-    pieces.append(f"OD={op_date_iso}")
-    pieces.append(f"VD={val_date_iso}")
-    pieces.append(f"CUR={_sanitize_val(row.get('currency')) or 'EUR'}")
-    pieces.append(f"AMT={_format_amount(amount)}")
-
-    payer_name = _sanitize_val(row.get("payer name"))
-    payer_acc_raw = _sanitize_val(row.get("payer account"))
-    payer_bc = _sanitize_val(row.get("payer bank code"))
-    payee_name = _sanitize_val(row.get("payee name"))
-    payee_acc_raw = _sanitize_val(row.get("payee account"))
-    payee_bc = _sanitize_val(row.get("payee bank code"))
-
+        pieces.append("BT=" + bt)
+    pieces += (
+        "OD=" + op_date_iso,
+        "VD=" + val_date_iso,
+        "CUR=" + (srow["currency"] or "EUR"),
+        "AMT=" + _format_amount(amount),
+    )
     if payer_name:
-        pieces.append(f"PAYER={payer_name}")
+        pieces.append("PAYER=" + payer_name)
     if payer_acc_raw:
-        pieces.append(f"PAYER_ACC={payer_acc_raw}")
+        pieces.append("PAYER_ACC=" + payer_acc_raw)
     if payer_bc:
-        pieces.append(f"PAYER_BC={payer_bc}")
-
+        pieces.append("PAYER_BC=" + payer_bc)
     if payee_name:
-        pieces.append(f"PAYEE={payee_name}")
+        pieces.append("PAYEE=" + payee_name)
     if payee_acc_raw:
-        pieces.append(f"PAYEE_ACC={payee_acc_raw}")
+        pieces.append("PAYEE_ACC=" + payee_acc_raw)
     if payee_bc:
-        pieces.append(f"PAYEE_BC={payee_bc}")
-
-    pt = _sanitize_val(row.get("purpose text"))
+        pieces.append("PAYEE_BC=" + payee_bc)
     if pt:
-        pieces.append(f"PT={pt}")
-    ref = _sanitize_val(row.get("reference")) or _sanitize_val(row.get("record number"))
+        pieces.append("PT=" + pt)
     if ref:
-        pieces.append(f"REF={ref}")
-    rd = _sanitize_val(row.get("record data"))
+        pieces.append("REF=" + ref)
     if rd is not None:
-        pieces.append(f"RD={rd}")
-
+        pieces.append("RD=" + rd)
     return " | ".join(pieces)
 
 class AccountStatementImportBASheet(models.TransientModel):
     _inherit = "account.statement.import"
 
+    def _read_calamine_rows_strict(self, workbook_cls, content: bytes):
+        """calamine variant of the XLSX branch of _read_excel_rows_strict
+        (same ``(rows, idx)`` contract).
+
+        Note: calamine loads the whole sheet range up front; only the row
+        records are built lazily.
+        """
+        wb = workbook_cls.from_filelike(io.BytesIO(content))
+        it = iter(wb.get_sheet_by_index(0).iter_rows())
+        header_row = next(it, None)
+        if header_row is None:
+            raise UserError(_("Empty Excel file."))
+        idx = _map_headers(header_row)
+        positions = _row_positions(idx)
+
+        def _records():
+            for row in it:
+                # calamine returns "" (not None) for empty cells; 0 counts as data.
+                if not any(row):
+                    if all(v is None or v == "" for v in row):
+                        continue
+                # Whitespace-only text rows are empty too, as in the openpyxl
+                # branch. Typical rows stop at the first cell.
+                elif not any(v.strip() if v.__class__ is str else v is not None for v in row):
+                    continue
+                row_len = len(row)
+                yield _Row._make([_calamine_cell_xlsx(row[c]) if c < row_len else None for c in positions])
+
+        return _records(), idx
+
     def _read_excel_rows_strict(self, content: bytes, kind: str):
+        """Validate the header line and return ``(rows, idx)``.
+
+        ``rows`` is a generator yielding one ``_Row`` per non-empty data
+        row; it is consumed once, so each row can be transformed and dropped.
+
+        ``python-calamine`` (Rust-backed) reads XLSX when installed; its cell
+        values are normalized to openpyxl's, so the payload does not depend on
+        which reader ran. XLS is always read by xlrd: calamine does not expose
+        the workbook's date mode (1900/1904), which xlrd's serial dates need.
+        """
         if kind == "xlsx":
+            workbook_cls = _calamine_workbook_cls()
+            if workbook_cls is not None:
+                return self._read_calamine_rows_strict(workbook_cls, content)
             try:
                 from openpyxl import load_workbook
             except Exception as e:
                 raise UserError(_("Missing python dependency 'openpyxl' to read XLSX: %s") % e)
-            wb = load_workbook(io.BytesIO(content), read_only=True, data_only=True)
-            ws = wb.worksheets[0]
-            it = ws.iter_rows(values_only=True)
+            wb = load_workbook(io.BytesIO(content), read_only=True, data_only=True, keep_links=False)
             try:
-                headers = [str(h or "").strip() for h in next(it)]
-            except StopIteration:
-                raise UserError(_("Empty Excel file."))
-            norm = [_norm(h) for h in headers]
-            idx = {}
-            for i, h in enumerate(norm):
-                if h in ALL_HEADERS:
-                    idx[h] = i
-            missing = [h for h in REQUIRED_HEADERS if h not in idx]
-            if missing:
-                raise UserError(_("Missing required columns: %s") % ", ".join(missing))
-            rows = []
-            for row in it:
-                if not any(v not in (None, "") for v in row):
-                    continue
-                rec: Dict[str, object] = {}
-                for key, col in idx.items():
-                    if col < len(row):
-                        rec[key] = row[col]
-                rows.append(rec)
-            return rows, idx
+                ws = wb.worksheets[0]
+                header_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), None)
+                if header_row is None:
+                    raise UserError(_("Empty Excel file."))
+                idx = _map_headers(header_row)
+            except Exception:
+                wb.close()
+                raise
+            positions = _row_positions(idx)
+            it = ws.iter_rows(min_row=2, values_only=True)
+
+            def _records():
+                try:
+                    for row in it:
+                        # any(row) settles most rows in C; only all-falsy rows
+                        # (None/""/0/False) need the exact check, since 0 counts as data.
+                        if not any(row):
+                            if all(v is None or v == "" for v in row):
+                                continue
+                        # Whitespace-only text rows are empty too, as for calamine
+                        # (which reads such cells as "") and xlrd.
+                        elif not any(v.strip() if v.__class__ is str else v is not None for v in row):
+                            continue
+                        row_len = len(row)
+                        yield _Row._make([row[c] if c < row_len else None for c in positions])
+                finally:
+                    wb.close()
+
+            return _records(), idx
         else:
             try:
                 import xlrd  # xlrd<2.0
             except Exception as e:
                 raise UserError(_("To read legacy .XLS files, install 'xlrd<2.0' or export as XLSX. Error: %s") % e)
-            book = xlrd.open_workbook(file_contents=content)
-            sheet = book.sheet_by_index(0)
-            if sheet.nrows == 0:
-                raise UserError(_("Empty Excel file."))
-            headers = [str(sheet.cell_value(0, c)).strip() for c in range(sheet.ncols)]
-            norm = [_norm(h) for h in headers]
-            idx = {}
-            for i, h in enumerate(norm):
-                if h in ALL_HEADERS:
-                    idx[h] = i
-            missing = [h for h in REQUIRED_HEADERS if h not in idx]
-            if missing:
-                raise UserError(_("Missing required columns: %s") % ", ".join(missing))
-            rows = []
-            for r in range(1, sheet.nrows):
-                if not any((str(sheet.cell_value(r, c)) if sheet.cell_value(r, c) is not None else "").strip() for c in range(sheet.ncols)):
-                    continue
-                rec: Dict[str, object] = {}
-                for key, col in idx.items():
-                    val = sheet.cell_value(r, col)
-                    if key in ("operation date", "value date") and sheet.cell_type(r, col) == 3:
-                        val = xlrd.xldate_as_datetime(val, book.datemode)
-                    rec[key] = val
-                rows.append(rec)
-            return rows, idx
+            # on_demand: only the first sheet is parsed; the others are never loaded.
+            book = xlrd.open_workbook(file_contents=content, on_demand=True, formatting_info=False)
+            try:
+                sheet = book.sheet_by_index(0)
+                if sheet.nrows == 0:
+                    raise UserError(_("Empty Excel file."))
+                idx = _map_headers(sheet.row_values(0))
+            except Exception:
+                book.release_resources()
+                raise
+
+            empty_types = (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK)
+            text_type = xlrd.XL_CELL_TEXT
+            positions = _row_positions(idx)
+            # (field, column) of the date fields; xlrd returns date cells as serial floats.
+            date_pos = tuple((ALL_HEADERS.index(h), idx[h]) for h in ("operation date", "value date"))
+
+            def _records():
+                try:
+                    for r in range(1, sheet.nrows):
+                        # One fetch of the whole row; cells are then indexed locally.
+                        row = sheet.row_values(r)
+                        # Type check first; only text cells need a strip() (whitespace-only → empty).
+                        if not any(t not in empty_types and (t != text_type or row[c].strip())
+                                   for c, t in enumerate(sheet.row_types(r))):
+                            continue
+                        row_len = len(row)
+                        vals = [row[c] if c < row_len else None for c in positions]
+                        for i, c in date_pos:
+                            if sheet.cell_type(r, c) == xlrd.XL_CELL_DATE:
+                                vals[i] = xlrd.xldate_as_datetime(vals[i], book.datemode)
+                        yield _Row._make(vals)
+                finally:
+                    book.release_resources()
+
+            return _records(), idx
 
     def _parse_file(self, data_file):
         _logger.debug("BA sheet: start parsing")
@@ -276,55 +459,74 @@ class AccountStatementImportBASheet(models.TransientModel):
             _logger.debug("BA sheet: not xls/xlsx -> passing to super()")
             return super()._parse_file(data_file)
 
+        # Timings (DEBUG) to compare reader/loop changes across versions.
+        t_start = time.perf_counter()
         rows, header_idx = self._read_excel_rows_strict(content, kind)
-        _logger.debug("BA sheet: read %d data rows from Excel.", len(rows))
+        t_open = time.perf_counter()
 
+        owner_accounts = _get_owner_accounts(self)
         txs = []
-        first_date = None
-        last_date = None
-
-        for idx, r in enumerate(rows, start=1):
-            currency = str(r.get("currency") or "").strip().upper()
-            if currency not in ("EUR", "€"):
-                raise UserError(_("Non-EUR row detected (row %s): %s") % (idx, currency))
-
-            amount = float(_parse_number(r.get("amount")))
-            od_iso = _to_iso_date(r.get("operation date"))
-            vd_iso = _to_iso_date(r.get("value date"))
-            if od_iso:
-                if first_date is None or od_iso < first_date:
-                    first_date = od_iso
-                if last_date is None or od_iso > last_date:
-                    last_date = od_iso
-
-            partner_name = _choose_partner_name(self, r)
-            payref = _build_payment_ref(r, amount, od_iso, vd_iso)
-
-            # unique id: date + amount + first 32 chars of booking text
-            bt = _sanitize_val(r.get("booking text")) or ""
-            bt_prefix = bt[:32]
-            uid_seed = f"{od_iso}|{amount:.2f}|{bt_prefix}"
-            import hashlib
-            unique_import_id = hashlib.sha1(uid_seed.encode("utf-8")).hexdigest()
-
-            tx = {
-                "date": od_iso or fields.Date.today().isoformat(),
-                "payment_ref": payref or _("Bank transaction"),
-                "amount": amount,
-                "unique_import_id": unique_import_id,
-            }
-            if partner_name:
-                tx["partner_name"] = partner_name
-
-            txs.append(tx)
+        dates = []
+
+        # Rows are streamed: each one is read, transformed and dropped.
+        try:
+            for idx, r in enumerate(rows, start=1):
+                # Currency first, before any other per-row work. Exports use
+                # "EUR" verbatim; only a miss pays for sanitize + upper().
+                currency = r.currency
+                if currency not in _EUR_CURRENCIES:
+                    currency = (_sanitize_val(currency) or "").upper()
+                    if currency not in _EUR_CURRENCIES:
+                        raise UserError(_("Non-EUR row detected (row %s): %s") % (idx, currency))
+
+                srow = _sanitize_row(r)
+                amount = _parse_number(r.amount)
+                od_iso = _to_iso_date(r.operation_date)
+                vd_iso = _to_iso_date(r.value_date)
+                if od_iso:
+                    dates.append(od_iso)
+
+                partner_name = _choose_partner_name(owner_accounts, srow)
+                payref = _build_payment_ref(srow, amount, od_iso, vd_iso)
+
+                # unique id: date + amount + first 32 chars of booking text.
+                # One encode + one sha1() call; splitting the seed over several
+                # update() calls measured slower for seeds this short.
+                bt_prefix = (srow["booking text"] or "")[:32]
+                unique_import_id = hashlib.sha1(
+                    f"{od_iso}|{amount:.2f}|{bt_prefix}".encode("utf-8")
+                ).hexdigest()
+
+                tx = {
+                    "date": od_iso or fields.Date.today().isoformat(),
+                    "payment_ref": payref or _("Bank transaction"),
+                    "amount": amount,
+                    "unique_import_id": unique_import_id,
+                }
+                if partner_name:
+                    tx["partner_name"] = partner_name
+
+                txs.append(tx)
+        finally:
+            rows.close()
+            # Cached strings are import-specific; don't keep them around between imports.
+            _to_iso_date_str.cache_clear()
+            _sanitize_dirty.cache_clear()
+        t_rows = time.perf_counter() - t_open
+        _logger.debug(
+            "BA sheet: read %d data rows from Excel (open+headers %.3fs; rows %.3fs, %.0f rows/s).",
+            len(txs), t_open - t_start, t_rows, len(txs) / t_rows if t_rows > 0 else 0.0,
+        )
 
         if not txs:
             raise UserError(_("No transactions found after validation."))
 
         # Sort lines ASC by date (and UID for stability)
-        txs.sort(key=lambda t: (t["date"], t["unique_import_id"]))
+        txs.sort(key=itemgetter("date", "unique_import_id"))
 
-        # Statement dates and name
+        # Statement dates and name (ISO strings → lexicographic min/max is chronological)
+        first_date = min(dates) if dates else None
+        last_date = max(dates) if dates else None
         stmt_date = last_date or fields.Date.today().isoformat()
         if first_date and last_date and first_date != last_date:
             stmt_name = _("Bank Austria import %s..%s (EUR)") % (first_date, last_date)
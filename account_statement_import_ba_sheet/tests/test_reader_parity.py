@@ -0,0 +1,105 @@
+import io
+import sys
+from datetime import datetime, time
+from unittest.mock import patch
+
+from odoo.exceptions import UserError
+from odoo.tests import TransactionCase, tagged
+
+from ..models import account_statement_import_ba_sheet as ba_sheet
+
+HEADERS = [
+    "Operation date", "Value Date", "Booking text", "Internal Note", "Currency", "Amount",
+    "Record data", "Record Number", "Payer Name", "Payer Account", "Payee Name", "Payee Account",
+    "Reference",
+]
+# Numeric cells in text columns end up in payment_ref and unique_import_id.
+ROWS = [
+    [datetime(2024, 1, 3), datetime(2024, 1, 3), 4711, "n", "EUR", -500,
+     datetime(2024, 1, 2), 7, 123, 4711, "Landlord", "AT99", 123],
+    ["02.01.2024", "02.01.2024", "Salary", "n", "eur", 1234.56,
+     datetime(2024, 1, 2, 10, 30), 8.5, "Corp", "AT99", "Me", 1e16, True],
+]
+
+
+@tagged("post_install", "-at_install")
+class TestReaderParity(TransactionCase):
+    """The payload must not depend on whether python-calamine is installed."""
+
+    def setUp(self):
+        super().setUp()
+        if ba_sheet._calamine_workbook_cls() is None:
+            self.skipTest("python-calamine (with CalamineSheet.iter_rows) not installed")
+        self.wizard = self.env["account.statement.import"]
+
+    def _parse_without_calamine(self, content):
+        with patch.object(ba_sheet, "_calamine_workbook_cls", return_value=None):
+            return self.wizard._parse_file(content)
+
+    def test_xlsx_parity(self):
+        from openpyxl import Workbook
+
+        wb = Workbook()
+        ws = wb.active
+        ws.append(HEADERS)
+        for row in ROWS:
+            ws.append(row)
+        buf = io.BytesIO()
+        wb.save(buf)
+        content = buf.getvalue()
+        self.assertEqual(self.wizard._parse_file(content), self._parse_without_calamine(content))
+
+    def test_xlsx_whitespace_row_skipped(self):
+        from openpyxl import Workbook
+
+        wb = Workbook()
+        ws = wb.active
+        ws.append(HEADERS)
+        ws.append(ROWS[0])
+        ws.append(["", "", "  ", None, " "])
+        buf = io.BytesIO()
+        wb.save(buf)
+        content = buf.getvalue()
+        with_calamine = self.wizard._parse_file(content)
+        self.assertEqual(len(with_calamine[0][2][0]["transactions"]), 1)
+        self.assertEqual(with_calamine, self._parse_without_calamine(content))
+
+    def _xls_content(self, dates_1904=False):
+        try:
+            import xlrd  # noqa: F401
+            import xlwt
+        except ImportError:
+            self.skipTest("xlrd/xlwt not installed")
+        date_fmt = xlwt.easyxf(num_format_str="DD.MM.YYYY")
+        time_fmt = xlwt.easyxf(num_format_str="HH:MM")
+        wb = xlwt.Workbook()
+        wb.dates_1904 = dates_1904
+        ws = wb.add_sheet("Sheet1")
+        for c, h in enumerate(HEADERS):
+            ws.write(0, c, h)
+        # A time-only cell in a text column: its serial is epoch-relative too.
+        rows = ROWS + [["03.01.2024", "03.01.2024", "Fee", "n", "EUR", -1, time(10, 30)]]
+        for r, row in enumerate(rows, start=1):
+            for c, v in enumerate(row):
+                if isinstance(v, datetime):
+                    ws.write(r, c, v, date_fmt)
+                elif isinstance(v, time):
+                    ws.write(r, c, v, time_fmt)
+                else:
+                    ws.write(r, c, v)
+        buf = io.BytesIO()
+        wb.save(buf)
+        return buf.getvalue()
+
+    def test_xls_parity(self):
+        for dates_1904 in (False, True):
+            with self.subTest(dates_1904=dates_1904):
+                content = self._xls_content(dates_1904)
+                self.assertEqual(self.wizard._parse_file(content), self._parse_without_calamine(content))
+
+    def test_xls_requires_xlrd(self):
+        content = self._xls_content()
+        # calamine does not stand in for xlrd on .xls (no 1904 date mode).
+        with patch.dict(sys.modules, {"xlrd": None}):
+            with self.assertRaises(UserError):
+                self.wizard._parse_file(content)